@@ -13,6 +13,7 @@
 # limitations under the License.
 # ============================================================================
 """DAG Circuit."""
+import copy
 import typing
 
 from mindquantum.core import Circuit, gates
@@ -153,6 +154,10 @@ class DAGCircuit:
 
     Args:
         circuit (:class:`~.core.circuit.Circuit`): the input quantum circuit.
+        copy_operations (bool): whether to deep copy every gate of the input circuit
+            into the DAG nodes. If ``False``, the DAG nodes share gate objects with
+            the input circuit, which skips one full copy of the circuit, but you should
+            not mutate those gates afterwards. Default: ``False``.
 
     Examples:
         >>> from mindquantum.algorithm.compiler import DAGCircuit
@@ -165,13 +170,15 @@ class DAGCircuit:
         {0: H(0)}
     """
 
-    def __init__(self, circuit: Circuit):
+    def __init__(self, circuit: Circuit, copy_operations: bool = False):
         """Initialize a DAGCircuit object."""
         _check_input_type("circuit", Circuit, circuit)
         self.head_node = {i: QubitNode(i) for i in sorted(circuit.all_qubits.keys())}
         self.final_node = {i: QubitNode(i) for i in sorted(circuit.all_qubits.keys())}
         for i in self.head_node:
             self.head_node[i].insert_after(self.final_node[i])
+        if copy_operations:
+            circuit = copy.deepcopy(circuit)
         for gate in circuit:
             if isinstance(gate, gates.BarrierGate):
                 if gate.obj_qubits:
@@ -298,6 +305,22 @@ class DAGCircuit:
                 _find(current_node, found)
         return [i for i in found if not isinstance(i, QubitNode)]
 
+    def gate_kinds(self) -> typing.Set[str]:
+        """
+        Find the name of every kind of gate in this :class:`~.algorithm.compiler.DAGCircuit`.
+
+        Returns:
+            Set[str], the gate names that appear in this :class:`~.algorithm.compiler.DAGCircuit`.
+
+        Examples:
+            >>> from mindquantum.algorithm.compiler import DAGCircuit
+            >>> from mindquantum.core.circuit import Circuit
+            >>> circ = Circuit().h(0).h(1).x(1, 0)
+            >>> sorted(DAGCircuit(circ).gate_kinds())
+            ['H', 'X']
+        """
+        return {node.gate.name for node in self.find_all_gate_node()}
+
     def layering(self) -> typing.List[Circuit]:
         r"""
         Layering the quantum circuit.
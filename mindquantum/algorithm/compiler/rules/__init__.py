@@ -19,6 +19,7 @@ from .basic_rule import (
     KroneckerSeqCompiler,
     SequentialCompiler,
     compile_circuit,
+    compile_circuits,
 )
 from .compiler_logger import CompileLog, LogIndentation
 from .device_based import CZBasedChipCompiler
@@ -37,4 +38,5 @@ __all__ = [
     'FullyNeighborCanceler',
     'SimpleNeighborCanceler',
     'compile_circuit',
+    'compile_circuits',
 ]
@@ -339,21 +339,23 @@ class BasicDecompose(BasicCompilerRule):
         _check_input_type("dag_circuit", DAGCircuit, dag_circuit)
         compiled = False
         all_node = dag_circuit.find_all_gate_node()
-        CLog.log(f"Running {CLog.R1(self.rule_name)}.", 1, self.log_level)
+        CLog.log(lambda: f"Running {CLog.R1(self.rule_name)}.", 1, self.log_level)
         with LogIndentation() as _:
             for node in all_node:
                 decompose_dag_circ = decom_basic_gate(node.gate, prefer_u3=self.prefer_u3)
                 if decompose_dag_circ:
                     compiled = True
                     CLog.log(
-                        f"{CLog.R1(self.rule_name)}: gate {CLog.B(node.gate)} will be compiled.", 2, self.log_level
+                        lambda: f"{CLog.R1(self.rule_name)}: gate {CLog.B(node.gate)} will be compiled.",
+                        2,
+                        self.log_level,
                     )
                     with LogIndentation() as _:
                         self.do(decompose_dag_circ)
                     dag_circuit.replace_node_with_dag_circuit(node, decompose_dag_circ)
 
         if compiled:
-            CLog.log(f"{CLog.R1(self.rule_name)}: {CLog.P('successfully compiled')}.", 1, self.log_level)
+            CLog.log(lambda: f"{CLog.R1(self.rule_name)}: {CLog.P('successfully compiled')}.", 1, self.log_level)
         else:
-            CLog.log(f"{CLog.R1(self.rule_name)}: nothing happened.", 1, self.log_level)
+            CLog.log(lambda: f"{CLog.R1(self.rule_name)}: nothing happened.", 1, self.log_level)
         return compiled
@@ -13,10 +13,18 @@
 # limitations under the License.
 # ============================================================================
 """Basic compiler rule."""
+import copy
+import os
+import sys
 import typing
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 from mindquantum.core.circuit import Circuit
+from mindquantum.core.gates import BarrierGate, KrausChannel, Measure, NoiseGate, ParameterGate
 
 from ..dag import DAGCircuit
 from .compiler_logger import CompileLog as CLog
@@ -41,11 +49,51 @@ class BasicCompilerRule(ABC):
             will be displayed. Default: ``0``.
     """
 
+    __slots__ = ("_rule_name", "log_level", "_r1_name", "_r2_name")
+
+    # Gate kinds (gate names) that must appear in the DAG circuit before this rule
+    # can fire. If empty, the rule always runs.
+    REQUIRES: typing.FrozenSet[str] = frozenset()
+    # Gate kinds this rule may add into the DAG circuit when it fires.
+    PRODUCES: typing.FrozenSet[str] = frozenset()
+    # Whether this rule only inspects the DAG circuit without modifying it. Read-only
+    # rules can be dispatched concurrently by SequentialCompiler(parallel=True).
+    READ_ONLY: bool = False
+    # Gate kinds this rule class declares interest in, set through the applies_to
+    # class keyword. If empty, the rule applies to every DAG circuit.
+    APPLIES_TO: typing.FrozenSet[str] = frozenset()
+    # All known compiler rule classes, collected at class-creation time.
+    _registry: typing.List[type] = []
+
+    def __init_subclass__(cls, applies_to=(), **kwargs):
+        """Register the rule class and record which gate kinds it applies to."""
+        super().__init_subclass__(**kwargs)
+        if applies_to:
+            cls.APPLIES_TO = frozenset(applies_to)
+        BasicCompilerRule._registry.append(cls)
+
+    @classmethod
+    def all_rules(cls) -> typing.Tuple[type, ...]:
+        """Get every compiler rule class defined so far."""
+        return tuple(cls._registry)
+
     def __init__(self, rule_name="BasicCompilerRule", log_level=0):
         """Initialize a basic compiler rule."""
         self.rule_name = rule_name
         self.log_level = log_level
 
+    @property
+    def rule_name(self) -> str:
+        """Get the name of this compiler rule."""
+        return self._rule_name
+
+    @rule_name.setter
+    def rule_name(self, rule_name: str):
+        """Set the name of this compiler rule and refresh the cached colorized labels."""
+        self._rule_name = sys.intern(rule_name)
+        self._r1_name = CLog.R1(rule_name)
+        self._r2_name = CLog.R2(rule_name)
+
     def __repr__(self):
         """Get string expression of rule."""
         return f"{self.rule_name}<>"
@@ -61,6 +109,16 @@ class BasicCompilerRule(ABC):
         self.log_level = log_level
         return self
 
+    def set_all_log_level(self, log_level: int):
+        """
+        Set display log level for this rule and, for composite rules, every child rule.
+
+        Args:
+            log_level (int): the display log level. Could be ``0``, ``1`` or ``2``. For more explanation of log level,
+                please refers to :class:`~.algorithm.compiler.BasicCompilerRule`.
+        """
+        return self.set_log_level(log_level)
+
     @abstractmethod
     def do(self, dag_circuit: DAGCircuit) -> bool:
         """
@@ -71,6 +129,17 @@ class BasicCompilerRule(ABC):
         """
 
 
+_read_only_executor: typing.Optional[ThreadPoolExecutor] = None
+
+
+def _get_read_only_executor() -> ThreadPoolExecutor:
+    """Get the shared thread pool that dispatches read-only compiler rules."""
+    global _read_only_executor  # pylint: disable=global-statement
+    if _read_only_executor is None:
+        _read_only_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix='mq-compile')
+    return _read_only_executor
+
+
 class SequentialCompiler(BasicCompilerRule):
     """
     A sequential of compiler.
@@ -82,17 +151,55 @@ class SequentialCompiler(BasicCompilerRule):
         rule_name (str): name of this compiler. Default: ``"SequentialCompiler"``.
         log_level (int): the display log level. Could be ``0``, ``1`` or ``2``. For more explanation of log level,
                 please refers to :class:`~.algorithm.compiler.BasicCompilerRule`. Default: ``0``.
+        parallel (bool): whether to run consecutive read-only child rules (rules whose
+                ``READ_ONLY`` flag is ``True``) concurrently in a thread pool. Rules
+                that modify the DAG circuit always run one by one. Default: ``False``.
     """
 
-    def __init__(self, compilers: typing.List[BasicCompilerRule], rule_name="SequentialCompiler", log_level=0):
+    __slots__ = (
+        "compilers",
+        "_nested_compilers",
+        "_do_fns",
+        "parallel",
+        "_compiled_do",
+        "_needs_gate_kinds",
+    )
+
+    def __init__(
+        self,
+        compilers: typing.List[BasicCompilerRule],
+        rule_name="SequentialCompiler",
+        log_level=0,
+        parallel=False,
+    ):
         """Initialize a sequential compiler rule."""
-        self.compilers = compilers
+        # Inline the children of plain sequential compilers, so that deep nested
+        # composition costs a single flat loop in do(). Subclasses such as
+        # KroneckerSeqCompiler keep their own execution semantics and stay intact.
+        flat = []
+        for compiler in compilers:
+            if not isinstance(compiler, BasicCompilerRule):
+                raise TypeError(f"compilers requires a BasicCompilerRule, but get {type(compiler)}.")
+            if type(compiler) is SequentialCompiler:  # pylint: disable=unidiomatic-typecheck
+                flat.extend(compiler.compilers)
+            else:
+                flat.append(compiler)
+        self.compilers = tuple(flat)
+        self._nested_compilers = tuple(compilers)
+        self._do_fns = tuple(compiler.do for compiler in flat)
+        self.parallel = parallel
+        self._compiled_do = None
+        # Gate-kind bookkeeping costs a full DAG traversal per sweep; skip it
+        # entirely unless some child actually declares an interest.
+        self._needs_gate_kinds = any(compiler.REQUIRES or compiler.APPLIES_TO for compiler in flat)
         super().__init__(rule_name, log_level)
 
     def __repr__(self):
         """Get string expression of rule."""
+        # Not cached on purpose: renaming a child anywhere in the tree must show
+        # up here, and a single join per display is already cheap.
         strs = [f'{self.rule_name}<']
-        for compiler in self.compilers:
+        for compiler in self._nested_compilers:
             for i in compiler.__repr__().split('\n'):
                 strs.append("  " + i)
         strs.append('>')
@@ -108,12 +215,106 @@ class SequentialCompiler(BasicCompilerRule):
         """
         self.log_level = log_level
         for compiler in self.compilers:
-            if hasattr(compiler, "set_all_log_level"):
-                compiler.set_all_log_level(log_level)
-            else:
-                compiler.set_log_level(log_level)
+            compiler.set_all_log_level(log_level)
         return self
 
+    @staticmethod
+    def _run_read_only_batch(compilers, dag_circuit: DAGCircuit, gate_kinds) -> typing.List[bool]:
+        """Run a batch of read-only child rules concurrently on the shared thread pool."""
+
+        def _run(compiler):
+            applies_to = compiler.APPLIES_TO
+            if (compiler.REQUIRES and not compiler.REQUIRES & gate_kinds) or (
+                applies_to and not applies_to & gate_kinds
+            ):
+                return False
+            return compiler.do(dag_circuit)
+
+        if len(compilers) == 1:
+            return [_run(compilers[0])]
+        return list(_get_read_only_executor().map(_run, compilers))
+
+    def _run_children(self, dag_circuit: DAGCircuit, compilers=None, collect_states=True):
+        """
+        Run every child rule once, skipping rules whose required gate kinds are absent.
+
+        When `collect_states` is ``True``, return the state of each child rule as a
+        list. Otherwise only return whether any child rule fired, which avoids the
+        per-call list construction when the detail log is off.
+        """
+        if compilers is None:
+            compilers = self.compilers
+            do_fns = self._do_fns
+        else:
+            do_fns = [compiler.do for compiler in compilers]
+        n_children = len(compilers)
+        track_kinds = self._needs_gate_kinds
+        gate_kinds = dag_circuit.gate_kinds() if track_kinds else frozenset()
+        states = [] if collect_states else None
+        compiled = False
+        idx = 0
+        while idx < n_children:
+            compiler = compilers[idx]
+            if self.parallel and compiler.READ_ONLY:
+                batch = []
+                while idx < n_children and compilers[idx].READ_ONLY:
+                    batch.append(compilers[idx])
+                    idx += 1
+                batch_states = self._run_read_only_batch(batch, dag_circuit, gate_kinds)
+                compiled = any(batch_states) or compiled
+                if collect_states:
+                    states.extend(batch_states)
+                continue
+            applies_to = compiler.APPLIES_TO
+            if (compiler.REQUIRES and not compiler.REQUIRES & gate_kinds) or (
+                applies_to and not applies_to & gate_kinds
+            ):
+                state = False
+            else:
+                state = do_fns[idx](dag_circuit)
+                if state:
+                    compiled = True
+                    if track_kinds:
+                        if compiler.PRODUCES:
+                            gate_kinds |= compiler.PRODUCES
+                        else:
+                            gate_kinds = dag_circuit.gate_kinds()
+            if collect_states:
+                states.append(state)
+            idx += 1
+        return states if collect_states else compiled
+
+    def _codegen_do(self) -> str:
+        """Generate source code of a driver that inlines every child rule call."""
+        lines = ["def _do(dag_circuit):"]
+        lines.append("    compiled = rule_0.do(dag_circuit)")
+        for i in range(1, len(self.compilers)):
+            lines.append(f"    compiled = rule_{i}.do(dag_circuit) or compiled")
+        lines.append("    return compiled")
+        return '\n'.join(lines)
+
+    def compile(self) -> typing.Callable[[DAGCircuit], bool]:
+        """
+        Generate a specialized driver function for this fixed rule pipeline.
+
+        The driver inlines every child rule call with literal control flow, skipping
+        the per-call list construction, gate-kind bookkeeping and log handling of
+        ``do``. Once generated, ``do`` delegates to the driver, so pipelines that
+        are applied to many circuits pay the generic machinery only once. Note that
+        the driver never skips a child rule and never displays log.
+
+        Returns:
+            Callable[[:class:`~.algorithm.compiler.DAGCircuit`], bool], the specialized driver.
+        """
+        if self._compiled_do is None:
+            if not self.compilers:
+                self._compiled_do = lambda dag_circuit: False
+                return self._compiled_do
+            namespace = {f"rule_{i}": compiler for i, compiler in enumerate(self.compilers)}
+            exec(self._codegen_do(), namespace)  # pylint: disable=exec-used
+            self._compiled_do = namespace['_do']
+        return self._compiled_do
+
     def do(self, dag_circuit: DAGCircuit) -> bool:
         """
         Apply sequential compiler to dag circuit.
@@ -121,17 +322,36 @@ class SequentialCompiler(BasicCompilerRule):
         Args:
             dag_circuit (:class:`~.algorithm.compiler.DAGCircuit`): The DAG graph of quantum circuit.
         """
+        if self._compiled_do is not None:
+            return self._compiled_do(dag_circuit)
+        if self.log_level == 0:
+            # Fast path: no log to render, so skip the indentation context and
+            # message thunks entirely.
+            return self._run_children(dag_circuit, collect_states=False)
         compiled = False
-        child_name = ', '.join(CLog.R2(compiler.rule_name) for compiler in self.compilers)
-        CLog.log(f"Running {CLog.R1(self.rule_name)}: {len(self.compilers)} child ({child_name}, ).", 1, self.log_level)
+        CLog.log(
+            lambda: (
+                f"Running {self._r1_name}: {len(self.compilers)} child "
+                f"({', '.join(compiler._r2_name for compiler in self.compilers)}, )."
+            ),
+            1,
+            self.log_level,
+        )
         with LogIndentation() as _:
-            states = [compiler.do(dag_circuit) for compiler in self.compilers]
-            CLog.log(f"{CLog.R1(self.rule_name)}: state for each rule -> {CLog.ShowState(states)}", 2, self.log_level)
-        compiled = any(states)
+            if self.log_level >= 2:
+                states = self._run_children(dag_circuit)
+                CLog.log(
+                    lambda: f"{self._r1_name}: state for each rule -> {CLog.ShowState(states)}",
+                    2,
+                    self.log_level,
+                )
+                compiled = any(states)
+            else:
+                compiled = self._run_children(dag_circuit, collect_states=False)
         if compiled:
-            CLog.log(f"{CLog.R1(self.rule_name)}: {CLog.P('successfully compiled')}.", 1, self.log_level)
+            CLog.log(lambda: f"{self._r1_name}: {CLog.P('successfully compiled')}.", 1, self.log_level)
         else:
-            CLog.log(f"{CLog.R1(self.rule_name)}: nothing happened.", 1, self.log_level)
+            CLog.log(lambda: f"{self._r1_name}: nothing happened.", 1, self.log_level)
         return compiled
 
 
@@ -148,10 +368,51 @@ class KroneckerSeqCompiler(SequentialCompiler):
             For more explanation of log level, please refers to :class:`~.algorithm.compiler.BasicCompilerRule`.
     """
 
+    __slots__ = ()
+
     def __init__(self, compilers: typing.List[BasicCompilerRule], rule_name="KroneckerSeqCompiler", log_level=0):
         """Initialize a KroneckerSeqCompiler."""
         super().__init__(compilers, rule_name, log_level)
 
+    def _codegen_do(self) -> str:
+        """Generate source code of a driver that inlines the fixed-point loop."""
+        lines = ["def _do(dag_circuit):"]
+        lines.append("    compiled = False")
+        lines.append("    while True:")
+        lines.append("        state = rule_0.do(dag_circuit)")
+        for i in range(1, len(self.compilers)):
+            lines.append(f"        state = rule_{i}.do(dag_circuit) or state")
+        lines.append("        if not state:")
+        lines.append("            break")
+        lines.append("        compiled = True")
+        lines.append("    return compiled")
+        return '\n'.join(lines)
+
+    def _converge(self, dag_circuit: DAGCircuit) -> bool:
+        """Run the fixed-point loop without any log handling."""
+        compiled = False
+        dirty = None
+        while True:
+            if dirty is None:
+                active = self.compilers
+            else:
+                active = [c for c in self.compilers if not c.REQUIRES or c.REQUIRES & dirty]
+            if not active:
+                break
+            states = self._run_children(dag_circuit, active)
+            if not any(states):
+                break
+            compiled = True
+            dirty = set()
+            for compiler, state in zip(active, states):
+                if state:
+                    if compiler.PRODUCES:
+                        dirty |= compiler.PRODUCES
+                    else:
+                        dirty = None
+                        break
+        return compiled
+
     def do(self, dag_circuit: DAGCircuit) -> bool:
         """
         Apply kronecker compiler to dag circuit.
@@ -159,33 +420,125 @@ class KroneckerSeqCompiler(SequentialCompiler):
         Args:
             dag_circuit (:class:`~.algorithm.compiler.DAGCircuit`): The DAG graph of quantum circuit.
         """
+        if self._compiled_do is not None:
+            return self._compiled_do(dag_circuit)
+        if self.log_level == 0:
+            return self._converge(dag_circuit)
         compiled = False
-        child_name = ', '.join(CLog.R2(compiler.rule_name) for compiler in self.compilers)
-        CLog.log(f"Running {CLog.R1(self.rule_name)}: {len(self.compilers)} child ({child_name}, ).", 1, self.log_level)
+        CLog.log(
+            lambda: (
+                f"Running {self._r1_name}: {len(self.compilers)} child "
+                f"({', '.join(compiler._r2_name for compiler in self.compilers)}, )."
+            ),
+            1,
+            self.log_level,
+        )
         with LogIndentation() as _:
+            dirty = None
             while True:
-                states = [compiler.do(dag_circuit) for compiler in self.compilers]
+                if dirty is None:
+                    active = self.compilers
+                else:
+                    # Only rules whose requirements overlap what the last sweep
+                    # produced could possibly fire again.
+                    active = [c for c in self.compilers if not c.REQUIRES or c.REQUIRES & dirty]
+                if not active:
+                    break
+                states = self._run_children(dag_circuit, active)
                 CLog.log(
-                    f"{CLog.R1(self.rule_name)}: state for each rule -> {CLog.ShowState(states)}", 2, self.log_level
+                    lambda: f"{self._r1_name}: state for each rule -> {CLog.ShowState(states)}",
+                    2,
+                    self.log_level,
                 )
-                if any(states):
-                    compiled = True
-                else:
+                if not any(states):
                     break
+                compiled = True
+                dirty = set()
+                for compiler, state in zip(active, states):
+                    if state:
+                        if compiler.PRODUCES:
+                            dirty |= compiler.PRODUCES
+                        else:
+                            # A rule fired without declaring what it emits, so
+                            # fall back to a full sweep.
+                            dirty = None
+                            break
         if compiled:
-            CLog.log(f"{CLog.R1(self.rule_name)}: {CLog.P('successfully compiled')}.", 1, self.log_level)
+            CLog.log(lambda: f"{self._r1_name}: {CLog.P('successfully compiled')}.", 1, self.log_level)
         else:
-            CLog.log(f"{CLog.R1(self.rule_name)}: nothing happened.", 1, self.log_level)
+            CLog.log(lambda: f"{self._r1_name}: nothing happened.", 1, self.log_level)
         return compiled
 
 
-def compile_circuit(compiler: BasicCompilerRule, circ: Circuit) -> Circuit:
+_MAX_COMPILE_CACHE_SIZE = 128
+_compile_circuit_cache: "OrderedDict[tuple, Circuit]" = OrderedDict()
+
+
+# Marks a gate whose state the fingerprint cannot fully capture; circuits
+# containing such a gate are never cached or deduplicated.
+_UNIDENTIFIED = object()
+
+
+def _gate_fingerprint(gate) -> tuple:
+    """Generate a hashable fingerprint of a placed gate.
+
+    Parameters are always included, so that parameter gates with different
+    constant coefficients (which have ``parameterized == False``) never collide.
+    Matrix-defined gates such as UnivMathGate contribute their matrix bytes,
+    noise channels their coefficients or Kraus operators, and measurements
+    their key. A gate the fingerprint cannot fully identify yields the
+    `_UNIDENTIFIED` sentinel instead.
+    """
+    if isinstance(gate, ParameterGate):
+        extra = tuple(str(pr) for pr in gate.get_parameters())
+    elif isinstance(gate, KrausChannel):
+        extra = tuple(np.asarray(op).tobytes() for op in gate.kraus_op)
+    elif isinstance(gate, NoiseGate):
+        # Every stock channel prints its coefficients in its string form.
+        extra = (str(gate), getattr(gate, 'hermitianed', False))
+    elif isinstance(gate, Measure):
+        extra = gate.key
+    elif isinstance(gate, BarrierGate):
+        extra = None
+    else:
+        matrix_value = getattr(gate, 'matrix_value', None)
+        if matrix_value is not None:
+            extra = (matrix_value.tobytes(), getattr(gate, 'hermitianed', False))
+        else:
+            extra = _UNIDENTIFIED
+    return (gate.name, tuple(gate.obj_qubits), tuple(gate.ctrl_qubits), extra)
+
+
+def _circuit_fingerprint(circ: Circuit) -> typing.Optional[tuple]:
+    """Generate a cheap hashable fingerprint of a circuit.
+
+    Returns ``None`` when some gate cannot be fully identified, in which case
+    the circuit must neither be cached nor deduplicated against others.
+    """
+    fingerprint = tuple(_gate_fingerprint(gate) for gate in circ)
+    if any(gate_fp[-1] is _UNIDENTIFIED for gate_fp in fingerprint):
+        return None
+    return fingerprint
+
+
+def compile_circuit(compiler: BasicCompilerRule, circ: Circuit, cache=True) -> Circuit:
     """
     Directly compile a given circuit and return the result.
 
+    The compiled result is memoized on the compiler instance and a fingerprint of
+    the input circuit (gate names, qubits, parameters and custom matrices), so that
+    recompiling the same circuit, which is common in variational loops, skips both
+    DAG conversions and the rule pipeline. Two compiler instances never share cache
+    entries, so differently configured pipelines cannot alias, and a circuit holding
+    a gate the fingerprint cannot fully identify is always compiled from scratch.
+    The memoization pool keeps at most 128 circuits, and the oldest one will be
+    dropped.
+
     Args:
         compiler (:class:`~.algorithm.compiler.BasicCompilerRule`): compile rules.
         circ (:class:`~.core.circuit.Circuit`): the input quantum circuit.
+        cache (bool): whether to reuse the compiled result when the same circuit was
+            already compiled by the same compiler. Default: ``True``.
 
     Returns:
         :class:`~.core.circuit.Circuit`, the final circuit compiled by given compiler.
@@ -208,6 +561,75 @@ def compile_circuit(compiler: BasicCompilerRule, circ: Circuit) -> Circuit:
                                                            │                    │         │          │
         q2: ───────────────────────────────────────────────●────────────────────●─────────●────T─────●──
     """
+    if cache:
+        fingerprint = _circuit_fingerprint(circ)
+        if fingerprint is None:
+            # Some gate carries state the fingerprint cannot capture, so a cache
+            # hit could return a wrong circuit; compile this one from scratch.
+            cache = False
+        else:
+            # Keyed on the identity of the compiler instance; the instance is pinned
+            # inside the cache entry so its id cannot be recycled while the entry lives.
+            key = (id(compiler), fingerprint)
+            entry = _compile_circuit_cache.get(key)
+            if entry is not None:
+                _compile_circuit_cache.move_to_end(key)
+                return copy.copy(entry[1])
     dag_circ = DAGCircuit(circ)
-    compiler.do(dag_circ)
-    return dag_circ.to_circuit()
+    changed = compiler.do(dag_circ)
+    # When no rule fired the DAG still holds the original gates, so skip the
+    # DAG to circuit rebuild.
+    out = dag_circ.to_circuit() if changed else circ
+    if cache:
+        _compile_circuit_cache[key] = (compiler, copy.copy(out))
+        if len(_compile_circuit_cache) > _MAX_COMPILE_CACHE_SIZE:
+            _compile_circuit_cache.popitem(last=False)
+    return out
+
+
+def compile_circuits(compiler: BasicCompilerRule, circs: typing.List[Circuit], cache=True) -> typing.List[Circuit]:
+    """
+    Compile a batch of quantum circuits, compiling each unique circuit only once.
+
+    The circuits are grouped by the same fingerprint that :func:`compile_circuit`
+    memoizes on, one representative per group runs through the rule pipeline, and
+    every other member of the group receives a copy of the result. A batch with
+    few unique circuit structures therefore costs as many pipeline runs as there
+    are unique circuits, not as many as there are batch entries. Circuits whose
+    fingerprint is incomplete (they hold a gate it cannot fully identify) are
+    never grouped and always compiled individually.
+
+    Args:
+        compiler (:class:`~.algorithm.compiler.BasicCompilerRule`): compile rules.
+        circs (List[:class:`~.core.circuit.Circuit`]): the input quantum circuits.
+        cache (bool): whether to also use the memoization pool of
+            :func:`compile_circuit`. Default: ``True``.
+
+    Returns:
+        List[:class:`~.core.circuit.Circuit`], the compiled circuits, in the same
+        order as the input.
+
+    Examples:
+        >>> from mindquantum.algorithm.compiler import compile_circuits, BasicDecompose
+        >>> from mindquantum.core import gates as G
+        >>> from mindquantum.core.circuit import Circuit
+        >>> circ = Circuit([G.Rxx('a').on([0, 1])])
+        >>> len(compile_circuits(BasicDecompose(), [circ, circ]))
+        2
+    """
+    groups = {}
+    out = [None] * len(circs)
+    for idx, circ in enumerate(circs):
+        fingerprint = _circuit_fingerprint(circ)
+        if fingerprint is None:
+            # The fingerprint cannot prove this circuit equal to any other, so
+            # it never joins a group and is compiled on its own.
+            out[idx] = compile_circuit(compiler, circ, cache=cache)
+        else:
+            groups.setdefault(fingerprint, []).append(idx)
+    for indexes in groups.values():
+        compiled = compile_circuit(compiler, circs[indexes[0]], cache=cache)
+        out[indexes[0]] = compiled
+        for idx in indexes[1:]:
+            out[idx] = copy.copy(compiled)
+    return out
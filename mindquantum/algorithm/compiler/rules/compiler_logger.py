@@ -69,12 +69,15 @@ class CompileLog:
         print(' ' * CompileLog.HEAD_BLOCK + f"{msg}")
 
     @staticmethod
-    def log(msg: str, log_level: int, filter_level: int):
+    def log(msg: typing.Union[str, typing.Callable[[], str]], log_level: int, filter_level: int):
         """
         Display compiler log message.
 
         Args:
-            msg (str): the log message.
+            msg (Union[str, Callable]): the log message, or a callable that builds the
+                message. A callable is only invoked when the message will actually be
+                displayed, so that callers can skip expensive formatting when log
+                is disabled.
             log_level (int): log level. Could be 0, 1, or 2.
             filter_level (int): disable log message by which filter level.
         """
@@ -89,6 +92,8 @@ class CompileLog:
             log_level = -1
         if log_level > filter_level:
             return
+        if callable(msg):
+            msg = msg()
         log_dict[log_level](msg)
 
     @staticmethod
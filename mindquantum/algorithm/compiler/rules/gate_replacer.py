@@ -80,6 +80,8 @@ class GateReplacer(BasicCompilerRule):
         self.wanted_example_circ = wanted_example_circ
         super().__init__("GateReplacer")
         self.permute_map = dict(enumerate(all_qubits))
+        self.REQUIRES = frozenset((ori_example_gate.name,))
+        self.PRODUCES = frozenset(gate.name for gate in wanted_example_circ)
 
     def __repr__(self):
         """Get string expression of gate replacer."""
@@ -100,7 +102,7 @@ class GateReplacer(BasicCompilerRule):
         """
         compiled = False
         all_node = dag_circuit.find_all_gate_node()
-        CLog.log(f"Running {CLog.R1(self.rule_name)}.", 1, self.log_level)
+        CLog.log(lambda: f"Running {CLog.R1(self.rule_name)}.", 1, self.log_level)
         with LogIndentation() as _:
             for node in all_node:
                 is_same = node.gate.__class__ == self.ori_example_gate.__class__
@@ -109,7 +111,9 @@ class GateReplacer(BasicCompilerRule):
                 is_same = is_same and (len(node.gate.ctrl_qubits) == len(self.ori_example_gate.ctrl_qubits))
                 if is_same:
                     CLog.log(
-                        f"{CLog.R1(self.rule_name)}: gate {CLog.B(node.gate)} will be replaced.", 2, self.log_level
+                        lambda: f"{CLog.R1(self.rule_name)}: gate {CLog.B(node.gate)} will be replaced.",
+                        2,
+                        self.log_level,
                     )
                     compiled = True
                     new_map = []
@@ -119,9 +123,9 @@ class GateReplacer(BasicCompilerRule):
                     new_circ = apply(self.wanted_example_circ, [i for _, i in new_map])
                     dag_circuit.replace_node_with_dag_circuit(node, DAGCircuit(new_circ))
         if compiled:
-            CLog.log(f"{CLog.R1(self.rule_name)}: {CLog.P('successfully compiled')}.", 1, self.log_level)
+            CLog.log(lambda: f"{CLog.R1(self.rule_name)}: {CLog.P('successfully compiled')}.", 1, self.log_level)
         else:
-            CLog.log(f"{CLog.R1(self.rule_name)}: nothing happened.", 1, self.log_level)
+            CLog.log(lambda: f"{CLog.R1(self.rule_name)}: nothing happened.", 1, self.log_level)
         return compiled
 
 
@@ -58,14 +58,14 @@ class SimpleNeighborCanceler(BasicCompilerRule):
 
         fc_pair_consided = set()
         compiled = False
-        CLog.log(f"Running {CLog.R1(self.rule_name)}.", 1, self.log_level)
+        CLog.log(lambda: f"Running {CLog.R1(self.rule_name)}.", 1, self.log_level)
         with LogIndentation() as _:
             for current_node in dag_circuit.head_node.values():
                 compiled = self._canceler(current_node, fc_pair_consided, dag_circuit) or compiled
         if compiled:
-            CLog.log(f"{CLog.R1(self.rule_name)}: {CLog.P('successfully compiled')}.", 1, self.log_level)
+            CLog.log(lambda: f"{CLog.R1(self.rule_name)}: {CLog.P('successfully compiled')}.", 1, self.log_level)
         else:
-            CLog.log(f"{CLog.R1(self.rule_name)}: nothing happened.", 1, self.log_level)
+            CLog.log(lambda: f"{CLog.R1(self.rule_name)}: nothing happened.", 1, self.log_level)
         return compiled
 
     def _merge_two_gates(self, current_node: GateNode, child_node: GateNode, fc_pair_consided, dag_circuit):
@@ -77,7 +77,7 @@ class SimpleNeighborCanceler(BasicCompilerRule):
         compiled = True
         with LogIndentation() as _:
             CLog.log(
-                f"{CLog.R1(self.rule_name)}: merge {CLog.B(current_node.gate)} and {CLog.B(child_node.gate)}.",
+                lambda: f"{CLog.R1(self.rule_name)}: merge {CLog.B(current_node.gate)} and {CLog.B(child_node.gate)}.",
                 2,
                 self.log_level,
             )
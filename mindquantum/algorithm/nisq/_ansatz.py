@@ -32,6 +32,12 @@ class Ansatz:  # pylint: disable=too-few-public-methods
         n_qubits (int): How many qubits this ansatz act on.
     """
 
+    # Empty on purpose: subclasses that want slotted instances declare the
+    # storage themselves (only one base of a multiple-inheritance chain may
+    # carry nonempty __slots__); subclasses that do not declare __slots__ keep
+    # getting a normal __dict__.
+    __slots__ = ()
+
     def __init__(self, name, n_qubits, *args, **kwargs):
         """Initialize an Ansatz object."""
         self.name = name
@@ -51,6 +57,10 @@ class Ansatz:  # pylint: disable=too-few-public-methods
         Returns:
             Circuit, the quantum circuit of this ansatz.
         """
+        if self._circuit is None:
+            materialize = getattr(self, '_materialize', None)
+            if materialize is not None:
+                materialize()
         return self._circuit
 
 
@@ -68,16 +78,18 @@ def single_qubit_gate_layer(
         pr_gen (:class:`~.core.parameterresolver.PRGenerator`): Object that generate parameters. If given `gate` is
             a sub class of ParameterGate, then `pr_gen` cannot be ``None``. Default: ``None``.
     """
-    circ = Circuit()
-    q_range = range(n_qubits)
-    if stop is not None:
-        q_range = range(n_qubits, stop)
-    for i in q_range:
-        if inspect.isclass(gate):
-            if issubclass(gate, ParameterGate):
-                circ += gate(pr_gen.new()).on(i)
-            elif issubclass(gate, NoneParameterGate):
-                circ += gate().on(i)
-        else:
-            circ += gate.on(i)
-    return circ
+    return Circuit(_single_qubit_gate_layer_gates(gate, n_qubits, stop, pr_gen))
+
+
+def _single_qubit_gate_layer_gates(
+    gate: typing.Union[ParameterGate, NoneParameterGate], n_qubits: int, stop: int = None, pr_gen: PRGenerator = None
+):
+    """Build the gate list of a single qubit gate layer without allocating an intermediate Circuit."""
+    q_range = range(n_qubits) if stop is None else range(n_qubits, stop)
+    if inspect.isclass(gate):
+        if issubclass(gate, ParameterGate):
+            return [gate(pr).on(i) for i, pr in zip(q_range, pr_gen.new_batch(len(q_range)))]
+        if issubclass(gate, NoneParameterGate):
+            return [gate().on(i) for i in q_range]
+        return []
+    return [gate.on(i) for i in q_range]
@@ -348,8 +348,20 @@ class Circuit(list):  # pylint: disable=too-many-instance-attributes,too-many-pu
             self.all_ansatz.merge(gates.all_ansatz)
             super().extend(gates)
         else:
+            collect_qubits = self.all_qubits.collect
+            raw_append = super().append
             for gate in gates:
-                self.append(gate)
+                _check_gate_type(gate)
+                _check_gate_has_obj(gate)
+                if isinstance(gate, mq_gates.Measure):
+                    self.all_measures.collect_only_one(gate, f'measure key {gate.key} already exist.')
+                if isinstance(gate, mq_gates.NoiseGate):
+                    self.all_noises.collect(gate.name)
+                collect_qubits(gate.obj_qubits)
+                collect_qubits(gate.ctrl_qubits)
+                if gate.parameterized:
+                    self._collect_parameterized_gate(gate)
+                raw_append(gate)
         self.has_cpp_obj = False
 
     def __add__(self, gates):
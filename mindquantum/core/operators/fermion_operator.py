@@ -386,7 +386,7 @@ class FermionOperator(FermionOperator_):
             True
         """
         dic = json.loads(strs)
-        out = FermionOperator().astype(mq.str_dtype_map[dic['dtype']])
+        out = FermionOperator().astype(mq.str_to_dtype(dic['dtype']))
         for c, t in zip(dic['values'], dic['terms']):
             out += FermionOperator(t, ParameterResolver.loads(c))
         return out
@@ -336,7 +336,7 @@ class QubitOperator(QubitOperator_):
             True
         """
         dic = json.loads(strs)
-        out = QubitOperator().astype(mq.str_dtype_map[dic['dtype']])
+        out = QubitOperator().astype(mq.str_to_dtype(dic['dtype']))
         for c, t in zip(dic['values'], dic['terms']):
             out += QubitOperator(t, ParameterResolver.loads(c))
         return out
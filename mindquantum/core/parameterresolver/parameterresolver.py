@@ -634,7 +634,7 @@ class ParameterResolver(ParameterResolver_):
         dic = json.loads(strs)
         if 'dtype' not in dic:
             raise ValueError("Invalid string. Cannot convert it to ParameterResolver, no key dtype")
-        dtype = mq.str_dtype_map[dic['dtype']]
+        dtype = mq.str_to_dtype(dic['dtype'])
         if dtype in mq.mq_complex_number_type:
             const = dic['const'][0] + 1j * dic['const'][1]
             data = {i: j[0] + j[1] * 1j for i, j in dic['pr_data'].items()}
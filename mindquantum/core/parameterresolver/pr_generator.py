@@ -14,6 +14,8 @@
 # ============================================================================
 """Parameter Generator."""
 
+import typing
+
 import mindquantum as mq
 
 from .parameterresolver import ParameterResolver
@@ -70,6 +72,24 @@ class PRGenerator:
         self.current_idx += 1
         return out
 
+    def new_batch(self, n: int) -> typing.List[ParameterResolver]:
+        """
+        Generate a batch of new parameters in one pass.
+
+        Equivalent to calling :meth:`new` ``n`` times, but hoists the attribute
+        lookups and counter updates out of the loop, which matters when a caller
+        needs many parameters at once.
+
+        Args:
+            n (int): the number of parameters to generate.
+        """
+        prefix, subfix, dtype = self.prefix, self.subfix, self.dtype
+        idx = self.current_idx
+        out = [ParameterResolver(f'{prefix}p{i}{subfix}', dtype=dtype) for i in range(idx, idx + n)]
+        self.all_pr.extend(out)
+        self.current_idx = idx + n
+        return out
+
     def size(self):
         """Get the total size of parameters that generated."""
         return self.current_idx
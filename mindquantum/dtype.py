@@ -13,6 +13,8 @@
 # limitations under the License.
 # ============================================================================
 """MindSpore Quantum dtype module."""
+from functools import lru_cache
+
 import numpy as np
 
 from mindquantum._math import dtype as dtype_
@@ -39,10 +41,40 @@ str_dtype_map = {
     str(complex128): complex128,
 }
 
+_str_dtype_map = {
+    'float32': float32,
+    'float64': float64,
+    'complex64': complex64,
+    'complex128': complex128,
+    **str_dtype_map,
+}
 
-def to_mq_type(dtype):
-    """Convert type to mindquantum type."""
-    type_mapper = {
+
+def str_to_dtype(name):
+    """
+    Get the mindquantum dtype named by a string.
+
+    Accepts both the short name (``'float32'``) and the printed form
+    (``'mindquantum.float32'``), without the per-call str() round-trip that a
+    str_dtype_map[str(dtype)] lookup pays.
+
+    Args:
+        name (str): the name of the data type.
+    """
+    out = _str_dtype_map.get(name)
+    if out is None and isinstance(name, str):
+        out = _str_dtype_map.get(name.lower())
+    if out is None:
+        raise TypeError(f"Unknown mindquantum dtype: {name}, now we support {list(_str_dtype_map.keys())}")
+    return out
+
+
+_type_mapper = None
+
+
+def _build_type_mapper():
+    """Build the conversion map to mindquantum types, with mindspore types when available."""
+    mapper = {
         float32: float32,
         float64: float64,
         complex128: complex128,
@@ -59,62 +91,81 @@ def to_mq_type(dtype):
         np.dtype(np.complex64): complex64,
         np.dtype(np.complex128): complex128,
     }
+    # Only ImportError is swallowed: mindspore being absent is expected, while a
+    # broken mindspore installation should surface to the caller.
     try:
         import mindspore as ms  # pylint: disable=import-outside-toplevel
 
-        type_mapper[ms.float32] = float32
-        type_mapper[ms.float64] = float64
-        type_mapper[ms.complex64] = complex64
-        type_mapper[ms.complex128] = complex128
+        mapper[ms.float32] = float32
+        mapper[ms.float64] = float64
+        mapper[ms.complex64] = complex64
+        mapper[ms.complex128] = complex128
     except ImportError:
         pass
+    return mapper
+
+
+@lru_cache(maxsize=32)
+def to_mq_type(dtype):
+    """Convert type to mindquantum type."""
+    global _type_mapper  # pylint: disable=global-statement
+    type_mapper = _type_mapper
+    if type_mapper is None:
+        type_mapper = _type_mapper = _build_type_mapper()
     if dtype not in type_mapper:
         raise TypeError(f"type error: {dtype}, now we support {list(type_mapper.keys())}")
     return type_mapper[dtype]
 
 
+_to_real_map = {
+    float32: float32,
+    float64: float64,
+    complex128: float64,
+    complex64: float32,
+}
+
+_to_complex_map = {
+    float32: complex64,
+    float64: complex128,
+    complex64: complex64,
+    complex128: complex128,
+}
+
+_to_double_map = {
+    float32: float64,
+    float64: float64,
+    complex128: complex128,
+    complex64: complex128,
+}
+
+_to_single_map = {
+    float32: float32,
+    float64: float32,
+    complex128: complex64,
+    complex64: complex64,
+}
+
+
+@lru_cache(maxsize=32)
 def to_real_type(dtype):
     """Convert type to real type."""
-    dtype = to_mq_type(dtype)
-    return {
-        float32: float32,
-        float64: float64,
-        complex128: float64,
-        complex64: float32,
-    }[dtype]
+    return _to_real_map[to_mq_type(dtype)]
 
 
+@lru_cache(maxsize=32)
 def to_complex_type(dtype):
     """Convert type to complex type."""
-    dtype = to_mq_type(dtype)
-    return {
-        float32: complex64,
-        float64: complex128,
-        complex64: complex64,
-        complex128: complex128,
-    }[dtype]
+    return _to_complex_map[to_mq_type(dtype)]
 
 
 def to_double_precision(dtype):
     """Convert type to double precision."""
-    dtype = to_mq_type(dtype)
-    return {
-        float32: float64,
-        float64: float64,
-        complex128: complex128,
-        complex64: complex128,
-    }[dtype]
+    return _to_double_map[to_mq_type(dtype)]
 
 
 def to_single_precision(dtype):
     """Convert type to single precision."""
-    dtype = to_mq_type(dtype)
-    return {
-        float32: float32,
-        float64: float32,
-        complex128: complex64,
-        complex64: complex64,
-    }[dtype]
+    return _to_single_map[to_mq_type(dtype)]
 
 
 def precision_like(dtype_src, dtype_des):
@@ -126,14 +177,17 @@ def precision_like(dtype_src, dtype_des):
     raise TypeError(f"Unknown dtype_des {dtype_des}")
 
 
+_to_np_map = {
+    complex128: np.complex128,
+    complex64: np.complex64,
+    float32: np.float32,
+    float64: np.float64,
+}
+
+
 def to_np_type(dtype):
     """Convert type to numpy data type."""
-    return {
-        complex128: np.complex128,
-        complex64: np.complex64,
-        float32: np.float32,
-        float64: np.float64,
-    }[dtype]
+    return _to_np_map[dtype]
 
 
 def is_double_precision(dtype):
@@ -0,0 +1,260 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+
+# pylint: disable=invalid-name
+'''test compiler rule pipeline and compile_circuit helpers'''
+import numpy as np
+import pytest
+
+from mindquantum.algorithm.compiler import (
+    BasicCompilerRule,
+    BasicDecompose,
+    DAGCircuit,
+    SequentialCompiler,
+    SimpleNeighborCanceler,
+    compile_circuit,
+    compile_circuits,
+)
+from mindquantum.core import gates as G
+from mindquantum.core.circuit import Circuit
+from mindquantum.core.gates.basic import FunctionalGate
+from mindquantum.algorithm.compiler.rules.basic_rule import (
+    _circuit_fingerprint,
+    _gate_fingerprint,
+)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+def test_compile_circuit_cache_constant_coefficient():
+    """
+    Description: Test that the compile_circuit cache distinguishes parameter gates
+        with different constant coefficients.
+    Expectation: success
+    """
+    compiler = BasicDecompose()
+    out_1 = compile_circuit(compiler, Circuit([G.Rxx(1.2).on([0, 1])]))
+    out_2 = compile_circuit(compiler, Circuit([G.Rxx(2.5).on([0, 1])]))
+    fresh_2 = compile_circuit(compiler, Circuit([G.Rxx(2.5).on([0, 1])]), cache=False)
+    assert np.allclose(out_2.matrix(), fresh_2.matrix())
+    assert not np.allclose(out_1.matrix(), out_2.matrix())
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+def test_compile_circuit_cache_hit_matches_fresh():
+    """
+    Description: Test that a cached compile_circuit result equals a fresh compilation.
+    Expectation: success
+    """
+    compiler = BasicDecompose()
+    circ = Circuit([G.Rxx('a').on([0, 1]), G.X.on(0, [1, 2])])
+    first = compile_circuit(compiler, circ)
+    second = compile_circuit(compiler, circ)
+    fresh = compile_circuit(compiler, circ, cache=False)
+    assert str(first) == str(second) == str(fresh)
+    assert second is not first
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+def test_circuit_fingerprint_matrix_gate():
+    """
+    Description: Test that matrix defined gates with equal names but different
+        matrices get different fingerprints.
+    Expectation: success
+    """
+    fp_1 = _circuit_fingerprint(Circuit([G.UnivMathGate('U', np.eye(2)).on(0)]))
+    fp_2 = _circuit_fingerprint(Circuit([G.UnivMathGate('U', np.array([[0, 1], [1, 0]])).on(0)]))
+    assert fp_1 != fp_2
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+def test_compile_circuit_cache_noise_channel():
+    """
+    Description: Test that the compile_circuit cache distinguishes noise channels
+        with different coefficients or Kraus operators.
+    Expectation: success
+    """
+    compiler = BasicDecompose()
+    compile_circuit(compiler, Circuit([G.AmplitudeDampingChannel(0.1).on(0)]))
+    out = compile_circuit(compiler, Circuit([G.AmplitudeDampingChannel(0.9).on(0)]))
+    assert out[0].gamma == 0.9
+    fp_1 = _gate_fingerprint(G.PauliChannel(0.1, 0.2, 0.3).on(0))
+    fp_2 = _gate_fingerprint(G.PauliChannel(0.3, 0.2, 0.1).on(0))
+    assert fp_1 != fp_2
+    kraus_1 = _gate_fingerprint(G.KrausChannel('K', [np.eye(2)]).on(0))
+    kraus_2 = _gate_fingerprint(G.KrausChannel('K', [np.array([[0, 1], [1, 0]])]).on(0))
+    assert kraus_1 != kraus_2
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+def test_dag_circuit_gate_kinds():
+    """
+    Description: Test gate kind collection of DAGCircuit.
+    Expectation: success
+    """
+    circ = Circuit().h(0).h(1).x(1, 0).rx('a', 0)
+    assert sorted(DAGCircuit(circ).gate_kinds()) == ['H', 'RX', 'X']
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+def test_dag_circuit_copy_operations():
+    """
+    Description: Test that DAGCircuit shares gates by default and copies them
+        when copy_operations is set.
+    Expectation: success
+    """
+    circ = Circuit().rx('a', 0)
+    shared = DAGCircuit(circ).to_circuit()
+    copied = DAGCircuit(circ, copy_operations=True).to_circuit()
+    assert shared[0] is circ[0]
+    assert copied[0] is not circ[0]
+    assert copied[0] == circ[0]
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+def test_compile_circuits_batch():
+    """
+    Description: Test batch compilation keeps input order and matches per-circuit
+        compilation, with duplicated circuits compiled once.
+    Expectation: success
+    """
+    compiler = BasicDecompose()
+    circ_a = Circuit([G.Rxx(1.2).on([0, 1])])
+    circ_b = Circuit([G.Rxx(2.5).on([0, 1])])
+    outs = compile_circuits(compiler, [circ_a, circ_b, circ_a], cache=False)
+    assert len(outs) == 3
+    assert str(outs[0]) == str(compile_circuit(compiler, circ_a, cache=False)) == str(outs[2])
+    assert str(outs[1]) == str(compile_circuit(compiler, circ_b, cache=False))
+    assert outs[2] is not outs[0]
+    assert not np.allclose(outs[0].matrix(), outs[1].matrix())
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+def test_compile_circuits_no_unsafe_grouping():
+    """
+    Description: Test that batch deduplication never merges circuits the
+        fingerprint cannot prove equal, independent of the cache flag.
+    Expectation: success
+    """
+    compiler = BasicDecompose()
+    circs = [
+        Circuit([G.AmplitudeDampingChannel(0.1).on(0)]),
+        Circuit([G.AmplitudeDampingChannel(0.9).on(0)]),
+    ]
+    for cache in (True, False):
+        outs = compile_circuits(compiler, circs, cache=cache)
+        assert outs[0][0].gamma == 0.1
+        assert outs[1][0].gamma == 0.9
+
+
+class _OpaqueGate(FunctionalGate):
+    """A stub gate carrying state the circuit fingerprint cannot capture."""
+
+    def __init__(self):
+        """Initialize the stub gate."""
+        super().__init__('Opaque', 1)
+
+    def get_cpp_obj(self):
+        """No backend object for the stub gate."""
+        raise NotImplementedError
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+def test_unidentified_gate_disables_fingerprint():
+    """
+    Description: Test that a circuit holding an unidentifiable gate has no
+        fingerprint and is compiled individually.
+    Expectation: success
+    """
+    assert _circuit_fingerprint(Circuit([_OpaqueGate().on(0)])) is None
+    outs = compile_circuits(BasicDecompose(), [Circuit([_OpaqueGate().on(0)])] * 2)
+    assert len(outs) == 2
+    assert all(out is not None for out in outs)
+
+
+class _CountGates(BasicCompilerRule):
+    """A read-only stub rule that only counts the gates of the DAG circuit."""
+
+    READ_ONLY = True
+
+    def __init__(self, requires=()):
+        """Initialize the stub rule."""
+        super().__init__("CountGates")
+        self.seen = []
+        if requires:
+            self.REQUIRES = frozenset(requires)
+
+    def do(self, dag_circuit):
+        """Count the gates without touching the DAG circuit."""
+        self.seen.append(len(dag_circuit.find_all_gate_node()))
+        return False
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+def test_sequential_compiler_parallel_read_only():
+    """
+    Description: Test that parallel dispatch runs read-only rules and applies the
+        same skip predicate as the serial path.
+    Expectation: success
+    """
+    circ = Circuit().h(0).h(0).x(1, 0)
+    ran = _CountGates()
+    skipped = _CountGates(requires=['RX'])
+    compiler = SequentialCompiler([ran, skipped, SimpleNeighborCanceler()], parallel=True)
+    assert compiler.do(DAGCircuit(circ))
+    assert ran.seen == [3]
+    assert not skipped.seen
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+def test_sequential_compiler_compile_driver():
+    """
+    Description: Test that the specialized driver of SequentialCompiler compiles
+        the same circuit as the generic do method.
+    Expectation: success
+    """
+    circ = Circuit().h(0).h(0).rx('a', 1)
+    compiler = SequentialCompiler([SimpleNeighborCanceler()])
+    dag_generic = DAGCircuit(circ)
+    assert compiler.do(dag_generic)
+    driver = compiler.compile()
+    dag_driver = DAGCircuit(circ)
+    assert driver(dag_driver)
+    assert str(dag_driver.to_circuit()) == str(dag_generic.to_circuit())
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+def test_compile_circuit_cache_per_compiler_instance():
+    """
+    Description: Test that differently configured compiler instances do not share
+        cache entries.
+    Expectation: success
+    """
+    circ = Circuit([G.Rxx(1.2).on([0, 1])])
+    out_u3 = compile_circuit(BasicDecompose(prefer_u3=True), circ)
+    compile_circuit(BasicDecompose(prefer_u3=False), circ)
+    fresh_u3 = compile_circuit(BasicDecompose(prefer_u3=True), circ, cache=False)
+    assert str(out_u3) == str(fresh_u3)
@@ -0,0 +1,70 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+'''test ansatz from arxiv 1905.10876'''
+import pytest
+
+from mindquantum.algorithm.nisq.qnn import arxiv_1905_10876
+from mindquantum.algorithm.nisq.qnn.arxiv_1905_10876 import _template_cache
+from mindquantum.core.gates import BarrierGate
+
+_ALL_ANSATZES = [getattr(arxiv_1905_10876, name) for name in arxiv_1905_10876.__all__]
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+def test_cached_ansatz_matches_fresh():
+    """
+    Description: Test that an ansatz built from the template cache equals a fresh
+        build, for every ansatz of the module.
+    Expectation: success
+    """
+    for ansatz_cls in _ALL_ANSATZES:
+        _template_cache.clear()
+        fresh = ansatz_cls(4, 2)
+        cached = ansatz_cls(4, 2)
+        assert str(cached.circuit) == str(fresh.circuit)
+        assert cached.circuit.params_name == fresh.circuit.params_name
+        assert cached.pr_gen.size() == fresh.pr_gen.size()
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+def test_lazy_ansatz_matches_eager():
+    """
+    Description: Test that a lazily constructed ansatz defers the circuit build and
+        materializes the same circuit as eager construction.
+    Expectation: success
+    """
+    eager = arxiv_1905_10876.Ansatz5(4, 2)
+    lazy = arxiv_1905_10876.Ansatz5(4, 2, lazy=True)
+    assert lazy._circuit is None
+    assert str(lazy.circuit) == str(eager.circuit)
+    assert lazy.circuit.params_name == eager.circuit.params_name
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+def test_ansatz_without_barriers():
+    """
+    Description: Test that include_barriers=False strips the layer barriers and
+        keeps every other gate in order.
+    Expectation: success
+    """
+    with_barriers = arxiv_1905_10876.Ansatz2(4, 2).circuit
+    without_barriers = arxiv_1905_10876.Ansatz2(4, 2, include_barriers=False).circuit
+    assert any(isinstance(gate, BarrierGate) for gate in with_barriers)
+    assert not any(isinstance(gate, BarrierGate) for gate in without_barriers)
+    stripped = [gate for gate in with_barriers if not isinstance(gate, BarrierGate)]
+    assert list(without_barriers) == stripped
@@ -0,0 +1,41 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+'''test mindquantum dtype helpers'''
+import pytest
+
+import mindquantum as mq
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+@pytest.mark.parametrize('dtype', [mq.float32, mq.float64, mq.complex64, mq.complex128])
+def test_str_to_dtype(dtype):
+    """
+    Description: Test that str_to_dtype resolves both the short and the printed name
+    Expectation: success
+    """
+    assert mq.str_to_dtype(str(dtype)) == dtype
+    assert mq.str_to_dtype(str(dtype).split('.')[-1]) == dtype
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+def test_str_to_dtype_unknown():
+    """
+    Description: Test that str_to_dtype rejects an unknown name
+    Expectation: success
+    """
+    with pytest.raises(TypeError):
+        mq.str_to_dtype('float16')
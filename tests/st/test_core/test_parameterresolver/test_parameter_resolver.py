@@ -19,6 +19,7 @@ import pytest
 
 import mindquantum as mq
 from mindquantum.core.parameterresolver import ParameterResolver as PR
+from mindquantum.core.parameterresolver import PRGenerator
 
 
 @pytest.mark.level0
@@ -98,3 +99,20 @@ def test_parameter_resolver_pickle(dtype):
     """
     pr = PR({'a': 1.2}, dtype=dtype)
     assert pr == pickle.loads(pickle.dumps(pr))
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+def test_pr_generator_new_batch():
+    """
+    Description: Test that PRGenerator.new_batch matches repeated new() calls
+    Expectation: success
+    """
+    one_by_one = PRGenerator('a', 'b')
+    batched = PRGenerator('a', 'b')
+    expected = [one_by_one.new() for _ in range(3)]
+    got = batched.new_batch(3)
+    assert [pr.params_name for pr in got] == [pr.params_name for pr in expected]
+    assert batched.size() == one_by_one.size() == 3
+    assert batched.all_pr == one_by_one.all_pr
+    assert batched.new().params_name == one_by_one.new().params_name